@@ -0,0 +1,2 @@
+The Galaxy v3 collection and collection version lists now send an ``ETag`` naming the served
+repository version and answer ``If-None-Match`` with ``304 Not Modified``.
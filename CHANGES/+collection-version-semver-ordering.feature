@@ -0,0 +1,2 @@
+Added semantic version columns to ``CollectionVersion`` so version lists are sorted in the database.
+A migration populates them for existing collection versions.
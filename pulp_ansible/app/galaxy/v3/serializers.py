@@ -67,9 +67,7 @@ class CollectionSerializer(serializers.ModelSerializer):
     def get_highest_version(self, obj):
         """Get a highest version and its link."""
         available_versions = self.context["available_versions"][obj.pk]
-        version = sorted(
-            available_versions, key=lambda ver: semantic_version.Version(ver), reverse=True
-        )[0]
+        version = max(available_versions, key=semantic_version.Version)
         href = reverse(
             "collection-versions-detail",
             kwargs={
@@ -193,12 +191,18 @@ class UnpaginatedCollectionVersionSerializer(CollectionVersionListSerializer):
             "metadata",
         )
 
+    def _get_content_artifact(self, obj):
+        """
+        Get the ContentArtifact, reusing the prefetched one when available.
+        """
+        return obj.contentartifact_set.all()[0]
+
     @extend_schema_field(ArtifactRefSerializer)
     def get_artifact(self, obj):
         """
         Get atrifact summary.
         """
-        return ArtifactRefSerializer(obj.contentartifact_set.get()).data
+        return ArtifactRefSerializer(self._get_content_artifact(obj)).data
 
     def get_download_url(self, obj) -> str:
         """
@@ -206,7 +210,7 @@ class UnpaginatedCollectionVersionSerializer(CollectionVersionListSerializer):
         """
         host = settings.ANSIBLE_CONTENT_HOSTNAME.strip("/")
         distro_base_path = self.context["path"]
-        filename_path = obj.contentartifact_set.get().relative_path.lstrip("/")
+        filename_path = self._get_content_artifact(obj).relative_path.lstrip("/")
         download_url = f"{host}/{distro_base_path}/{filename_path}"
         return download_url
 
@@ -1,12 +1,13 @@
 from datetime import datetime
+from functools import wraps
 from gettext import gettext as _
-import semantic_version
 
 from django.contrib.postgres.aggregates import ArrayAgg
-from django.db.models import F
+from django.db.models import Count, F, Func, Max, Prefetch, Q
 from django.db.models.expressions import Window
 from django.db.models.functions.window import FirstValue
 from django.shortcuts import get_object_or_404
+from django.utils.cache import parse_etags
 from django.utils.dateparse import parse_datetime
 from django_filters import filters
 from drf_spectacular.utils import OpenApiParameter, extend_schema
@@ -18,7 +19,7 @@ from rest_framework import status as http_status
 from rest_framework import viewsets
 
 from pulpcore.plugin.exceptions import DigestValidationError
-from pulpcore.plugin.models import PulpTemporaryFile, Content
+from pulpcore.plugin.models import ContentArtifact, PulpTemporaryFile
 from pulpcore.plugin.serializers import AsyncOperationResponseSerializer
 from pulpcore.plugin.viewsets import BaseFilterSet
 
@@ -47,6 +48,62 @@ from pulp_ansible.app.galaxy.mixins import UploadGalaxyCollectionMixin
 from pulp_ansible.app.galaxy.v3.pagination import LimitOffsetPagination
 from pulp_ansible.app.viewsets import CollectionVersionFilter
 
+# Highest semantic version first. The prerelease key sorts releases above their prereleases and
+# only follows semver precedence under the "C" collation, see `prerelease_sort_key`.
+SEMVER_ORDERING = (
+    "-version_major",
+    "-version_minor",
+    "-version_patch",
+    Func(F("version_prerelease"), template='%(expressions)s COLLATE "C"').desc(),
+    "pk",
+)
+
+
+def prefetch_serialized_relations(queryset):
+    """
+    Loads the collection, content artifacts and tags read by the CollectionVersion serializers.
+
+    Args:
+        queryset (QuerySet): A CollectionVersion queryset.
+
+    Returns:
+        QuerySet: The queryset with the relations joined or prefetched.
+    """
+    return queryset.select_related("collection").prefetch_related(
+        Prefetch(
+            "contentartifact_set",
+            queryset=ContentArtifact.objects.select_related("artifact"),
+        ),
+        "tags",
+    )
+
+
+def conditional_on_repository_version(view_method):
+    """
+    Decorates a list action to answer with 304 Not Modified when the client's ETag matches.
+
+    The ETag comes from the view's `get_etag()`, so a response can be reused by clients
+    until the distribution's repository version changes.
+    """
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        etag = self.get_etag()
+        if etag is None:
+            return view_method(self, request, *args, **kwargs)
+
+        if_none_match = parse_etags(request.META.get("HTTP_IF_NONE_MATCH", ""))
+        # If-None-Match uses the weak comparison, so the W/ prefix is ignored
+        weak_etags = {tag[2:] if tag.startswith("W/") else tag for tag in if_none_match}
+        if "*" in weak_etags or etag[2:] in weak_etags:
+            response = Response(status=http_status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = view_method(self, request, *args, **kwargs)
+        response["ETag"] = etag
+        return response
+
+    return wrapper
+
 
 class AnsibleDistributionMixin:
     """
@@ -58,10 +115,13 @@ class AnsibleDistributionMixin:
         """Returns repository version."""
         path = self.kwargs["path"]
         context = getattr(self, "pulp_context", None)
-        if context and context.get(path, None):
-            return self.pulp_context[path]
+        if context and path in context:
+            return context[path]
 
-        distro = get_object_or_404(AnsibleDistribution, base_path=path)
+        distro = get_object_or_404(
+            AnsibleDistribution.objects.select_related("repository", "repository_version"),
+            base_path=path,
+        )
         if distro.repository_version:
             self.pulp_context = {path: distro.repository_version}
             return distro.repository_version
@@ -70,14 +130,39 @@ class AnsibleDistributionMixin:
         self.pulp_context = {path: repo_version}
         return repo_version
 
-    @property
-    def _distro_content(self):
-        """Returns distribution content."""
+    def _filter_distro_content(self, queryset, prefix=""):
+        """
+        Filters a queryset to the content of the distribution's repository version.
+
+        Joins on the content's repository memberships instead of using a `pk__in` subquery.
+
+        Args:
+            queryset: The queryset to filter.
+            prefix: The lookup path from the queryset model to the content, e.g. "versions__".
+
+        """
         repo_version = self._repository_version
         if repo_version is None:
-            return Content.objects.none()
+            return queryset.none()
+
+        memberships = f"{prefix}version_memberships"
+        return queryset.filter(
+            Q(
+                **{
+                    f"{memberships}__repository": repo_version.repository_id,
+                    f"{memberships}__version_added__number__lte": repo_version.number,
+                }
+            ),
+            Q(**{f"{memberships}__version_removed__isnull": True})
+            | Q(**{f"{memberships}__version_removed__number__gt": repo_version.number}),
+        )
 
-        return repo_version.content
+    def get_etag(self):
+        """Returns a weak ETag identifying the distribution's repository version."""
+        repo_version = self._repository_version
+        if repo_version is None:
+            return None
+        return f'W/"{repo_version.pk}-{repo_version.number}"'
 
     def get_serializer_context(self):
         """Inserts distribution path to a serializer context."""
@@ -100,14 +185,11 @@ class CollectionVersionRetrieveMixin:
             # drf_spectacular get filter from get_queryset().model
             # and it fails when "path" is not on self.kwargs
             return CollectionVersion.objects.none()
-        distro_content = self._distro_content
 
-        collections = CollectionVersion.objects.select_related(
-            "content_ptr__contentartifact"
-        ).filter(
-            pk__in=distro_content, namespace=self.kwargs["namespace"], name=self.kwargs["name"]
+        collections = CollectionVersion.objects.filter(
+            namespace=self.kwargs["namespace"], name=self.kwargs["name"]
         )
-        return collections
+        return self._filter_distro_content(collections)
 
     def retrieve(self, request, *args, **kwargs):
         """
@@ -173,6 +255,29 @@ class CollectionViewSet(
         self.deprecated_collections_context = deprecated  # needed by get__serializer_context
         return deprecated
 
+    def get_etag(self):
+        """
+        Returns a weak ETag identifying the repository version and its deprecations.
+
+        Deprecations can change without a new repository version, so they are part of the tag.
+        """
+        etag = super().get_etag()
+        if etag is None:
+            return None
+        deprecations = AnsibleCollectionDeprecated.objects.filter(
+            repository_version=self._repository_version
+        ).aggregate(count=Count("pk"), last_created=Max("pulp_created"))
+        last_created = deprecations["last_created"]
+        last_created = last_created.timestamp() if last_created else 0
+        return f'{etag[:-1]}-{deprecations["count"]}-{last_created}"'
+
+    @conditional_on_repository_version
+    def list(self, request, *args, **kwargs):
+        """
+        Returns paginated Collections list.
+        """
+        return super().list(request, *args, **kwargs)
+
     def get_queryset(self):
         """
         Returns a Collections queryset for specified distribution.
@@ -181,10 +286,7 @@ class CollectionViewSet(
             # drf_spectacular get filter from get_queryset().model
             # and it fails when "path" is not on self.kwargs
             return Collection.objects.none()
-        repo_version = self._repository_version
-        return Collection.objects.filter(
-            versions__in=repo_version.content,
-        )
+        return self._filter_distro_content(Collection.objects.all(), prefix="versions__")
 
     def append_context(self, queryset):
         """Appending collection data to context."""
@@ -332,7 +434,9 @@ class CollectionUploadViewSet(
         """
         Dispatch a Collection creation task.
         """
-        distro = get_object_or_404(AnsibleDistribution, base_path=path)
+        distro = get_object_or_404(
+            AnsibleDistribution.objects.select_related("repository"), base_path=path
+        )
         serializer = self.get_serializer(data=request.data, context={"request": request})
         serializer.is_valid(raise_exception=True)
 
@@ -403,13 +507,31 @@ class CollectionVersionViewSet(
         kwargs.setdefault("context", self.get_serializer_context)
         return self.list_serializer_class(*args, **kwargs)
 
+    def get_queryset(self):
+        """
+        Returns a CollectionVersions queryset, loading the relations read on retrieve.
+        """
+        queryset = super().get_queryset()
+        if self.action == "retrieve":
+            queryset = prefetch_serialized_relations(queryset)
+        return queryset
+
+    @conditional_on_repository_version
     def list(self, request, *args, **kwargs):
         """
         Returns paginated CollectionVersions list.
         """
         queryset = self.filter_queryset(self.get_queryset())
-        queryset = sorted(
-            queryset, key=lambda obj: semantic_version.Version(obj.version), reverse=True
+        queryset = queryset.order_by(*SEMVER_ORDERING)
+        # Only load the columns used by the list serializer
+        queryset = queryset.select_related("collection").only(
+            "namespace",
+            "name",
+            "version",
+            "requires_ansible",
+            "collection",
+            "collection__pulp_created",
+            "collection__pulp_last_updated",
         )
 
         context = self.get_serializer_context()
@@ -432,20 +554,18 @@ class UnpaginatedCollectionVersionViewSet(CollectionVersionViewSet):
         """
         Returns a CollectionVersions queryset for specified distribution.
         """
-        distro_content = self._distro_content
-
-        return CollectionVersion.objects.select_related("content_ptr__contentartifact").filter(
-            pk__in=distro_content
-        )
+        collections = prefetch_serialized_relations(CollectionVersion.objects.all())
+        # docs_blob, manifest and files are not part of the unpaginated serializer
+        collections = collections.defer("docs_blob", "manifest", "files", "search_vector")
+        return self._filter_distro_content(collections)
 
+    @conditional_on_repository_version
     def list(self, request, *args, **kwargs):
         """
         Returns paginated CollectionVersions list.
         """
         queryset = self.filter_queryset(self.get_queryset())
-        queryset = sorted(
-            queryset, key=lambda obj: semantic_version.Version(obj.version), reverse=True
-        )
+        queryset = queryset.order_by(*SEMVER_ORDERING)
 
         context = self.get_serializer_context()
         page = self.paginate_queryset(queryset)
@@ -481,7 +601,7 @@ class CollectionImportViewSet(
     ViewSet for CollectionImports.
     """
 
-    queryset = CollectionImport.objects.prefetch_related("task").all()
+    queryset = CollectionImport.objects.select_related("task").all()
     serializer_class = CollectionImportDetailSerializer
 
     since_filter = OpenApiParameter(
@@ -150,7 +150,9 @@ class GalaxyCollectionView(generics.ListAPIView, UploadGalaxyCollectionMixin):
         """
         Queues a task that creates a new Collection from an uploaded artifact.
         """
-        distro = get_object_or_404(AnsibleDistribution, base_path=path)
+        distro = get_object_or_404(
+            AnsibleDistribution.objects.select_related("repository"), base_path=path
+        )
         serializer = GalaxyCollectionUploadSerializer(
             data=request.data, context={"request": request}
         )
@@ -0,0 +1,72 @@
+from django.db import migrations, models
+import semantic_version as semver
+
+
+def prerelease_sort_key(prerelease):
+    # Copied from pulp_ansible.app.models so that this migration does not change with the model
+    if not prerelease:
+        return "~"
+    identifiers = []
+    for identifier in prerelease:
+        if identifier.isdigit():
+            identifiers.append("0" + identifier.zfill(20))
+        else:
+            identifiers.append("1" + identifier)
+    return "!".join(identifiers)[:255]
+
+
+def populate_semver_fields(apps, schema_editor):
+    CollectionVersion = apps.get_model("ansible", "CollectionVersion")
+    fields = ["version_major", "version_minor", "version_patch", "version_prerelease"]
+    batch = []
+    for collection_version in CollectionVersion.objects.only("pk", "version").iterator():
+        version = semver.Version(collection_version.version)
+        collection_version.version_major = version.major
+        collection_version.version_minor = version.minor
+        collection_version.version_patch = version.patch
+        collection_version.version_prerelease = prerelease_sort_key(version.prerelease)
+        batch.append(collection_version)
+        if len(batch) >= 1000:
+            CollectionVersion.objects.bulk_update(batch, fields, batch_size=1000)
+            batch = []
+    CollectionVersion.objects.bulk_update(batch, fields, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ansible', '0032_collectionremote_sync_dependencies'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='collectionversion',
+            name='version_major',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='collectionversion',
+            name='version_minor',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='collectionversion',
+            name='version_patch',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='collectionversion',
+            name='version_prerelease',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.RunPython(
+            code=populate_semver_fields, reverse_code=migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name='collectionversion',
+            index=models.Index(
+                fields=['namespace', 'name', 'version_major', 'version_minor', 'version_patch'],
+                name='cv_semver_ns_name',
+            ),
+        ),
+    ]
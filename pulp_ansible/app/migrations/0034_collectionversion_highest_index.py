@@ -0,0 +1,20 @@
+from django.db import migrations, models
+from django.db.models import Q
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ansible', '0033_collectionversion_semver_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='collectionversion',
+            index=models.Index(
+                condition=Q(is_highest=True),
+                fields=['namespace', 'name'],
+                name='cv_highest_ns_name',
+            ),
+        ),
+    ]
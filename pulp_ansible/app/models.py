@@ -1,5 +1,6 @@
 from logging import getLogger
 
+import semantic_version
 from django.db import models
 from django.contrib.postgres import fields as psql_fields
 from django.contrib.postgres import search as psql_search
@@ -19,6 +20,31 @@ from .downloaders import AnsibleDownloaderFactory
 log = getLogger(__name__)
 
 
+def prerelease_sort_key(prerelease):
+    """
+    Build a key for the prerelease identifiers of a version that sorts by semver precedence.
+
+    Numeric identifiers are zero-padded and sort below alphanumeric ones, identifiers are joined
+    by a separator lower than any identifier character and a release sorts above any prerelease.
+    The key must be compared with the "C" collation and is truncated to fit `version_prerelease`.
+
+    Args:
+        prerelease (tuple): The prerelease identifiers of a `semantic_version.Version`.
+
+    Returns:
+        str: The sortable key.
+    """
+    if not prerelease:
+        return "~"
+    identifiers = []
+    for identifier in prerelease:
+        if identifier.isdigit():
+            identifiers.append("0" + identifier.zfill(20))
+        else:
+            identifiers.append("1" + identifier)
+    return "!".join(identifiers)[:255]
+
+
 class Role(Content):
     """
     A content type representing a Role.
@@ -120,6 +146,11 @@ class CollectionVersion(Content):
         requires_ansible (models.CharField): The version of Ansible required to use the collection.
         is_highest (models.BooleanField): Indicates that the version is the highest one
             in the collection.
+        version_major (models.BigIntegerField): The major component of the version.
+        version_minor (models.BigIntegerField): The minor component of the version.
+        version_patch (models.BigIntegerField): The patch component of the version.
+        version_prerelease (models.CharField): A key of the prerelease component of the version
+            which sorts by semver precedence, see `prerelease_sort_key`.
 
     Relations:
 
@@ -149,6 +180,12 @@ class CollectionVersion(Content):
 
     is_highest = models.BooleanField(editable=False, default=False)
 
+    # Semantic version fields, populated from `version` on save so that sorting happens in SQL
+    version_major = models.BigIntegerField(default=0, editable=False)
+    version_minor = models.BigIntegerField(default=0, editable=False)
+    version_patch = models.BigIntegerField(default=0, editable=False)
+    version_prerelease = models.CharField(default="", blank=True, max_length=255, editable=False)
+
     # Foreign Key Fields
     collection = models.ForeignKey(
         Collection, on_delete=models.CASCADE, related_name="versions", editable=False
@@ -167,6 +204,17 @@ class CollectionVersion(Content):
             namespace=self.namespace, name=self.name, version=self.version
         )
 
+    def save(self, *args, **kwargs):
+        """
+        Populate the semantic version fields from `version` before saving.
+        """
+        version = semantic_version.Version(self.version)
+        self.version_major = version.major
+        self.version_minor = version.minor
+        self.version_patch = version.patch
+        self.version_prerelease = prerelease_sort_key(version.prerelease)
+        super().save(*args, **kwargs)
+
     class Meta:
         default_related_name = "%(app_label)s_%(model_name)s"
         unique_together = ("namespace", "name", "version")
@@ -177,6 +225,17 @@ class CollectionVersion(Content):
                 condition=Q(is_highest=True),
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["namespace", "name"],
+                name="cv_highest_ns_name",
+                condition=Q(is_highest=True),
+            ),
+            models.Index(
+                fields=["namespace", "name", "version_major", "version_minor", "version_patch"],
+                name="cv_semver_ns_name",
+            ),
+        ]
 
 
 class RoleRemote(Remote):
@@ -265,17 +324,8 @@ class AnsibleRepository(Repository):
         collection_versions_removed_pks = new_version.removed().values("pk")
         deprecated_in_this_version = deprecated_in_prev_version_qs.exclude(
             versions__in=collection_versions_removed_pks
-        )
-        to_deprecate = []
-        for collection_deprecated in deprecated_in_this_version:
-            to_deprecate.append(
-                AnsibleCollectionDeprecated(
-                    repository_version=new_version, collection=collection_deprecated
-                )
-            )
-
-        if to_deprecate:
-            AnsibleCollectionDeprecated.objects.bulk_create(to_deprecate, ignore_conflicts=True)
+        ).values_list("pk", flat=True)
+        carry_deprecations(deprecated_in_this_version, new_version)
 
 
 class AnsibleCollectionDeprecated(BaseModel):
@@ -292,6 +342,37 @@ class AnsibleCollectionDeprecated(BaseModel):
         unique_together = ("collection", "repository_version")
 
 
+# Collections read per query and deprecations inserted per statement by `carry_deprecations`
+DEPRECATION_BATCH_SIZE = 2000
+
+
+def carry_deprecations(collection_pks, repository_version):
+    """
+    Deprecate Collections within a RepositoryVersion.
+
+    The pks are streamed and the deprecations inserted in batches of `DEPRECATION_BATCH_SIZE`, so
+    memory stays bounded. Collections already deprecated in the RepositoryVersion are skipped.
+
+    Args:
+        collection_pks (QuerySet): A `values_list("pk", flat=True)` queryset of Collections.
+        repository_version (RepositoryVersion): The RepositoryVersion to deprecate them in.
+
+    """
+    to_deprecate = []
+    for collection_pk in collection_pks.iterator(chunk_size=DEPRECATION_BATCH_SIZE):
+        to_deprecate.append(
+            AnsibleCollectionDeprecated(
+                repository_version=repository_version, collection_id=collection_pk
+            )
+        )
+        if len(to_deprecate) >= DEPRECATION_BATCH_SIZE:
+            AnsibleCollectionDeprecated.objects.bulk_create(to_deprecate, ignore_conflicts=True)
+            to_deprecate = []
+
+    if to_deprecate:
+        AnsibleCollectionDeprecated.objects.bulk_create(to_deprecate, ignore_conflicts=True)
+
+
 class AnsibleDistribution(RepositoryVersionDistribution):
     """
     A Distribution for Ansible content.
@@ -53,6 +53,7 @@ from pulp_ansible.app.models import (
     CollectionRemote,
     CollectionVersion,
     Tag,
+    carry_deprecations,
 )
 from pulp_ansible.app.serializers import CollectionVersionSerializer, CollectionRemoteSerializer
 from pulp_ansible.app.tasks.utils import (
@@ -60,6 +61,7 @@ from pulp_ansible.app.tasks.utils import (
     parse_metadata,
     parse_collections_requirements_file,
     RequirementsFileEntry,
+    YAML_SAFE_LOADER,
 )
 
 
@@ -137,15 +139,11 @@ def sync(remote_pk, repository_pk, mirror, optimize):
         repository.last_synced_metadata_time = first_stage.last_synced_metadata_time
         repository.save()
 
-    to_deprecate = []
     if first_stage.deprecations:
-        collections_deprecate_true_qs = Collection.objects.filter(first_stage.deprecations)
-        for collection in collections_deprecate_true_qs:
-            to_deprecate.append(
-                AnsibleCollectionDeprecated(repository_version=repo_version, collection=collection)
-            )
-
-        AnsibleCollectionDeprecated.objects.bulk_create(to_deprecate, ignore_conflicts=True)
+        collections_deprecate_true_qs = Collection.objects.filter(
+            first_stage.deprecations
+        ).values_list("pk", flat=True)
+        carry_deprecations(collections_deprecate_true_qs, repo_version)
 
     non_deprecated_qs = Collection.objects.exclude(first_stage.deprecations)
     AnsibleCollectionDeprecated.objects.filter(
@@ -509,25 +507,25 @@ class CollectionSyncFirstStage(Stage):
                 collection_versions = collection_versions_list["results"]
             else:
                 collection_versions = collection_versions_list["data"]
-            for collection_version in collection_versions:
-                if collection_version["version"] in requirement:
-                    version_num = collection_version["version"]
-                    collection_version_detail_url = f"{collection_url}/versions/{version_num}/"
-                    if collection_metadata["deprecated"]:
-                        self.deprecations |= Q(namespace=namespace, name=name)
-                    tasks.append(
-                        loop.create_task(
-                            self._fetch_collection_version_metadata(
-                                api_version,
-                                collection_version_detail_url,
-                            )
-                        )
+            tasks.extend(
+                loop.create_task(
+                    self._fetch_collection_version_metadata(
+                        api_version,
+                        f"{collection_url}/versions/{collection_version['version']}/",
                     )
+                )
+                for collection_version in collection_versions
+                if collection_version["version"] in requirement
+            )
             next_value = self._get_response_next_value(api_version, collection_versions_list)
             if not next_value:
                 break
             page_num = page_num + 1
 
+        # Mark the collection once rather than once per matching version
+        if tasks and collection_metadata["deprecated"]:
+            self.deprecations |= Q(namespace=namespace, name=name)
+
         await asyncio.gather(*tasks)
 
     async def _read_from_downloaded_metadata(self, name, namespace, requirement):
@@ -855,7 +853,7 @@ class CollectionContentSaver(ContentSaver):
                         tar, "meta/runtime.yml", artifact.file.name, raise_exc=False
                     )
                     if runtime_metadata:
-                        runtime_yaml = yaml.safe_load(runtime_metadata)
+                        runtime_yaml = yaml.load(runtime_metadata, Loader=YAML_SAFE_LOADER)
                         collection_version.requires_ansible = runtime_yaml.get("requires_ansible")
                     manifest_data = json.load(
                         get_file_obj_from_tarball(tar, "MANIFEST.json", artifact.file.name)
@@ -2,7 +2,7 @@ from django.db import transaction
 from django.db.models import Q
 from pulpcore.plugin.models import RepositoryVersion
 
-from pulp_ansible.app.models import AnsibleCollectionDeprecated, AnsibleRepository, Collection
+from pulp_ansible.app.models import AnsibleRepository, Collection, carry_deprecations
 
 
 @transaction.atomic
@@ -64,14 +64,5 @@ def copy_content(config):
             new_version.add_content(content_to_copy)
             deprecated_in_source_repo_version_qs = Collection.objects.filter(
                 ansiblecollectiondeprecated__repository_version=source_repo_version
-            )
-            to_deprecate = []
-            for collection_deprecated in deprecated_in_source_repo_version_qs:
-                to_deprecate.append(
-                    AnsibleCollectionDeprecated(
-                        repository_version=new_version, collection=collection_deprecated
-                    )
-                )
-
-            if to_deprecate:
-                AnsibleCollectionDeprecated.objects.bulk_create(to_deprecate, ignore_conflicts=True)
+            ).values_list("pk", flat=True)
+            carry_deprecations(deprecated_in_source_repo_version_qs, new_version)
@@ -5,12 +5,18 @@ import json
 import re
 import yaml
 
-from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from rest_framework.serializers import ValidationError
 from yaml.error import YAMLError
 
 from pulp_ansible.app.constants import PAGE_SIZE
 
+# The libyaml based loader is much faster, fall back to the pure Python one when it is missing
+try:
+    YAML_SAFE_LOADER = yaml.CSafeLoader
+except AttributeError:
+    YAML_SAFE_LOADER = yaml.SafeLoader
+
 log = logging.getLogger(__name__)
 
 
@@ -24,17 +30,21 @@ def get_api_version(url):
 
 def get_page_url(url, api_version, page=1):
     """Get URL page."""
-    parsed_url = urlparse(url)
-    new_query = parse_qs(parsed_url.query)
-
     if api_version < 3:
-        new_query["page"] = page
-        new_query["page_size"] = PAGE_SIZE
+        page_params = (("page", page), ("page_size", PAGE_SIZE))
     else:
-        new_query["offset"] = (page - 1) * PAGE_SIZE
-        new_query["limit"] = PAGE_SIZE
+        page_params = (("offset", (page - 1) * PAGE_SIZE), ("limit", PAGE_SIZE))
+
+    split_url = urlsplit(url)
+    page_keys = {key for key, _value in page_params}
+    new_query = [
+        (key, value)
+        for key, value in parse_qsl(split_url.query, keep_blank_values=True)
+        if key not in page_keys
+    ]
+    new_query.extend(page_params)
 
-    return urlunparse(parsed_url._replace(query=urlencode(new_query, doseq=True)))
+    return urlunsplit(split_url._replace(query=urlencode(new_query)))
 
 
 def parse_metadata(download_result):
@@ -60,7 +70,8 @@ def parse_collections_requirements_file(requirements_file_string):
                     to pull the collection from
 
     Args:
-        requirements_file_string (str): The string of the requirements file.
+        requirements_file_string (str, bytes or file-like): The contents of the requirements
+            file. Bytes and file objects are handed to the YAML parser as is, without decoding.
 
     Returns:
         list: A list of RequirementsFileEntry objects, each containing `name`, `version`, and
@@ -74,7 +85,7 @@ def parse_collections_requirements_file(requirements_file_string):
 
     if requirements_file_string:
         try:
-            requirements = yaml.safe_load(requirements_file_string)
+            requirements = yaml.load(requirements_file_string, Loader=YAML_SAFE_LOADER)
         except YAMLError as err:
             raise ValidationError(
                 _(
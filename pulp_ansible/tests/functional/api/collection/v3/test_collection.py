@@ -2,6 +2,7 @@
 import hashlib
 import logging
 import re
+import uuid
 from datetime import datetime
 from urllib.parse import urljoin
 
@@ -198,6 +199,72 @@ def test_collection_version_list(artifact, pulp_client, collection_detail):
     assert version["href"] == collection_detail["highest_version"]["href"]
 
 
+@pytest.fixture(scope="session")
+def prerelease_collection_versions_url(pulp_client, pulp_dist):
+    """Upload versions of a new collection, including prereleases, out of order."""
+    namespace, name = "pulp", f"prerelease_{uuid.uuid4().hex[:8]}"
+    upload_url = get_galaxy_url(pulp_dist["base_path"], "/v3/artifacts/collections/")
+    for version in ["1.0.0-rc.2", "1.0.0", "1.0.0-beta.11", "1.0.0-rc.10", "1.0.0-beta.9", "0.9.0"]:
+        artifact = build_collection(
+            "skeleton", config={"namespace": namespace, "name": name, "version": version}
+        )
+        collection = {"file": (ANSIBLE_COLLECTION_FILE_NAME, open(artifact.filename, "rb"))}
+        pulp_client.using_handler(upload_handler).post(upload_url, files=collection)
+    return get_galaxy_url(pulp_dist["base_path"], f"/v3/collections/{namespace}/{name}/versions/")
+
+
+def test_collection_version_list_order(pulp_client, prerelease_collection_versions_url):
+    """Test the versions endpoint lists versions by semantic version precedence, highest first."""
+    versions = pulp_client.using_handler(api.json_handler).get(prerelease_collection_versions_url)
+
+    assert [version["version"] for version in versions["data"]] == [
+        "1.0.0",
+        "1.0.0-rc.10",
+        "1.0.0-rc.2",
+        "1.0.0-beta.11",
+        "1.0.0-beta.9",
+        "0.9.0",
+    ]
+
+
+def test_collection_list_etag(pulp_client, pulp_dist, collection_detail):
+    """Test the collections list answers conditional requests.
+
+    The ETag changes with the repository version and with the deprecations within it.
+    """
+    url = get_galaxy_url(pulp_dist["base_path"], "/v3/collections/")
+    echo_client = pulp_client.using_handler(api.echo_handler)
+    headers = pulp_client.request_kwargs.get("headers", {})
+
+    response = echo_client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = echo_client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+
+    # A new repository version
+    artifact = build_collection("skeleton")
+    collection = {"file": (ANSIBLE_COLLECTION_FILE_NAME, open(artifact.filename, "rb"))}
+    upload_url = get_galaxy_url(pulp_dist["base_path"], "/v3/artifacts/collections/")
+    pulp_client.using_handler(upload_handler).post(upload_url, files=collection)
+
+    response = echo_client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    etag = response.headers["ETag"]
+
+    # A deprecation within the same repository version
+    json_client = pulp_client.using_handler(api.json_handler)
+    json_client.patch(collection_detail["href"], {"deprecated": True})
+    try:
+        response = echo_client.get(url, headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+    finally:
+        json_client.patch(collection_detail["href"], {"deprecated": False})
+
+
 def test_collection_version(artifact, pulp_client, collection_detail):
     """Test collection version endpoint.
 
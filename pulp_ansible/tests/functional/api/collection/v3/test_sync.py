@@ -1,7 +1,9 @@
 """Tests related to sync ansible plugin collection content type."""
 import os
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
+from pulp_smash.pulp3.utils import gen_repo
 from pulpcore.client.pulp_ansible import (
     AnsibleRepositorySyncURL,
     ContentCollectionVersionsApi,
@@ -30,19 +32,37 @@ class SyncCollectionsFromPulpServerTestCase(TestCaseUsingBindings, SyncHelpersMi
 
     """
 
-    def setUp(self):
-        """Set up the Sync tests."""
-        self.requirements_file = "collections:\n  - testing.k8s_demo_collection"
+    @classmethod
+    def setUpClass(cls):
+        """Sync the first repository once and share it across the tests."""
+        super().setUpClass()
+        cls.requirements_file = "collections:\n  - testing.k8s_demo_collection"
         body = gen_ansible_remote(
             url="https://galaxy.ansible.com",
-            requirements_file=self.requirements_file,
+            requirements_file=cls.requirements_file,
             sync_dependencies=False,
         )
-        self.remote = self.remote_collection_api.create(body)
-        self.addCleanup(self.remote_collection_api.delete, self.remote.pulp_href)
+        cls.remote = cls.remote_collection_api.create(body)
+
+        first_repo = cls.repo_api.create(gen_repo(remote=cls.remote.pulp_href))
+        cls.first_repo = cls._sync_repo(cls(), first_repo, remote=cls.remote.pulp_href)
+        cls.distribution = cls._create_distribution_from_repo(cls(), cls.first_repo, cleanup=False)
 
-        self.first_repo = self._create_repo_and_sync_with_remote(self.remote)
-        self.distribution = self._create_distribution_from_repo(self.first_repo)
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down class variables."""
+        cls.distributions_api.delete(cls.distribution.pulp_href)
+        cls.repo_api.delete(cls.first_repo.pulp_href)
+        cls.remote_collection_api.delete(cls.remote.pulp_href)
+
+    def _list_content_of_first_versions(self, *repos):
+        """List the collection versions of each repo's version 1 concurrently."""
+        with ThreadPoolExecutor(max_workers=len(repos)) as executor:
+            futures = [
+                executor.submit(self.cv_api.list, repository_version=f"{repo.pulp_href}versions/1/")
+                for repo in repos
+            ]
+            return [future.result() for future in futures]
 
     def test_sync_collections_from_pulp(self):
         """Test sync collections from pulp server."""
@@ -56,11 +76,10 @@ class SyncCollectionsFromPulpServerTestCase(TestCaseUsingBindings, SyncHelpersMi
 
         second_repo = self._create_repo_and_sync_with_remote(second_remote)
 
-        first_content = self.cv_api.list(
-            repository_version=f"{self.first_repo.pulp_href}versions/1/"
+        first_content, second_content = self._list_content_of_first_versions(
+            self.first_repo, second_repo
         )
         self.assertGreaterEqual(len(first_content.results), 1)
-        second_content = self.cv_api.list(repository_version=f"{second_repo.pulp_href}versions/1/")
         self.assertGreaterEqual(len(second_content.results), 1)
 
     def test_sync_collections_from_pulp_using_mirror_second_time(self):
@@ -84,9 +103,10 @@ class SyncCollectionsFromPulpServerTestCase(TestCaseUsingBindings, SyncHelpersMi
 
         second_repo = self._create_repo_and_sync_with_remote(second_remote)
 
-        first_content = self.cv_api.list(repository_version=f"{first_repo.pulp_href}versions/1/")
+        first_content, second_content = self._list_content_of_first_versions(
+            first_repo, second_repo
+        )
         self.assertGreaterEqual(len(first_content.results), 1)
-        second_content = self.cv_api.list(repository_version=f"{second_repo.pulp_href}versions/1/")
         self.assertGreaterEqual(len(second_content.results), 1)
 
     def test_noop_resync_collections_from_pulp(self):